@@ -2316,7 +2316,7 @@ def send_teams_notification(config, submission_id, context):
     except requests.RequestException as e:
         return {'success': False, 'error': f'Teams notification failed: {str(e)}'}
 
-@shared_task
+@shared_task(ignore_result=True)
 def process_approval_workflow(submission_id):
     """Process approval workflow for a submission"""
     try:
@@ -2396,7 +2396,7 @@ def trigger_approval_webhook(submission, action):
             'user_name': submission.user.get_full_name() or submission.user.username
         })
 
-@shared_task
+@shared_task(ignore_result=True)
 def cleanup_old_executions():
     """Clean up old workflow executions"""
     from datetime import timedelta
@@ -2805,7 +2805,7 @@ def webhook_logs(request, webhook_id):
     return render(request, 'integration_hub/webhook_logs.html', context)
 
 # integration_hub/tasks.py
-@shared_task
+@shared_task(ignore_result=True)
 def test_integration_connection(integration_id):
     """Test integration connection asynchronously"""
     try:
@@ -2823,7 +2823,7 @@ def test_integration_connection(integration_id):
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
-@shared_task
+@shared_task(ignore_result=True)
 def sync_all_integrations():
     """Sync all active integrations"""
     active_integrations = Integration.objects.filter(is_active=True)
@@ -2856,81 +2856,137 @@ AUDIT_TRAIL_VIEWS = '''
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Count, Q
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce, Substr, TruncDate
 from django.utils import timezone
 from django.core.paginator import Paginator
-from datetime import timedelta, datetime
-from .models import AuditLog, ComplianceReport
+from django.core.cache import cache
+from datetime import timedelta, datetime, time
+from .models import AuditLog, AuditDailyRollup, ComplianceReport
 from .services import ComplianceReportGenerator, AuditAnalyzer
-import json
+from django.utils.functional import cached_property
+from django.db import transaction
+import hashlib
+import orjson
+
+_ACTION_LABELS = dict(AuditLog.ACTION_CHOICES)
+
+# Allowed dashboard time ranges, in days
+_RANGE_MAP = {'7d': 7, '30d': 30, '90d': 90}
+
+# The xlsx is built in full before it is sent, so it stays capped (CSV streams uncapped)
+_EXCEL_EXPORT_LIMIT = 10000
 
 def is_admin(user):
     return user.is_authenticated and hasattr(user, 'userprofile') and user.userprofile.is_admin
 
+class CachedCountPaginator(Paginator):
+    """Paginator that memoizes the COUNT(*) of the filtered queryset for a short time"""
+    
+    def __init__(self, object_list, per_page, cache_key, timeout=60, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.timeout = timeout
+    
+    @cached_property
+    def count(self):
+        return cache.get_or_set(self.cache_key, self.object_list.count, self.timeout)
+
+class Echo:
+    """File-like object whose write() just returns the value, for streaming csv.writer output"""
+    
+    def write(self, value):
+        return value
+
+def _iter_keyset(rows, batch_size=2000):
+    """Yield (id, timestamp, ...) rows newest first, one bounded keyset page per query.
+    
+    Replaces QuerySet.iterator(): PgBouncer's transaction pooling rules out
+    server-side cursors, and without them iterator() fetches everything at once.
+    """
+    rows = rows.order_by('-timestamp', '-id')
+    page = rows
+    while True:
+        batch = list(page[:batch_size])
+        if not batch:
+            return
+        yield from batch
+        last_id, last_timestamp = batch[-1][0], batch[-1][1]
+        page = rows.filter(
+            Q(timestamp__lt=last_timestamp) | Q(timestamp=last_timestamp, id__lt=last_id)
+        )
+
 @login_required
 @user_passes_test(is_admin)
 def audit_dashboard(request):
     """Main audit trail dashboard"""
     
-    # Time range filter
+    # Time range filter (unknown values fall back to 30d so they share one cache entry)
     time_range = request.GET.get('range', '30d')
-    if time_range == '7d':
-        start_date = timezone.now() - timedelta(days=7)
-    elif time_range == '30d':
-        start_date = timezone.now() - timedelta(days=30)
-    elif time_range == '90d':
-        start_date = timezone.now() - timedelta(days=90)
-    else:
-        start_date = timezone.now() - timedelta(days=30)
-    
-    # Audit statistics
-    total_events = AuditLog.objects.filter(timestamp__gte=start_date).count()
-    unique_users = AuditLog.objects.filter(
-        timestamp__gte=start_date,
-        user__isnull=False
-    ).values('user').distinct().count()
-    
-    # Action breakdown
-    action_breakdown = AuditLog.objects.filter(
-        timestamp__gte=start_date
-    ).values('action').annotate(count=Count('id')).order_by('-count')
+    if time_range not in _RANGE_MAP:
+        time_range = '30d'
+    days = _RANGE_MAP[time_range]
+    start_date = timezone.now() - timedelta(days=days)
+    window = AuditLog.objects.filter(timestamp__gte=start_date)
+    
+    # Rollups are cached briefly; they don't need to be real-time
+    cache_key = f'audit_dash:{time_range}'
+    aggregates = cache.get(cache_key)
+    if aggregates is None:
+        # Aggregates come from the hourly per-day rollup table, not raw events;
+        # rollup dates are local calendar days, so the window is too
+        since = timezone.localdate() - timedelta(days=days - 1)
+        rollups = AuditDailyRollup.objects.filter(date__gte=since)
+        
+        # Audit statistics (single pass over the time window)
+        stats = rollups.aggregate(
+            total=Coalesce(Sum('event_count'), 0),
+            unique_users=Count('user', distinct=True, filter=Q(user__isnull=False)),
+            high_impact=Coalesce(Sum('event_count', filter=Q(action__in=['delete', 'update', 'export'])), 0)
+        )
+        
+        # Action breakdown
+        action_breakdown = rollups.values('action').annotate(
+            count=Sum('event_count')
+        ).order_by('-count')
+        
+        # User activity trends
+        daily_activity = rollups.values('date').annotate(
+            count=Sum('event_count')
+        ).order_by('date')
+        
+        # Top active users
+        top_users = rollups.filter(
+            user__isnull=False
+        ).values('user__username', 'user__first_name', 'user__last_name').annotate(
+            activity_count=Sum('event_count')
+        ).order_by('-activity_count')[:10]
+        
+        # Content type breakdown
+        content_breakdown = rollups.filter(
+            content_type__isnull=False
+        ).values('content_type__model').annotate(count=Sum('event_count')).order_by('-count')
+        
+        aggregates = {
+            'total_events': stats['total'],
+            'unique_users': stats['unique_users'],
+            'high_impact_count': stats['high_impact'],
+            'action_breakdown': list(action_breakdown),
+            'daily_activity': list(daily_activity),
+            'top_users': list(top_users),
+            'content_breakdown': list(content_breakdown),
+        }
+        cache.set(cache_key, aggregates, 120)
     
     # Recent high-impact events
-    high_impact_events = AuditLog.objects.filter(
-        timestamp__gte=start_date,
+    high_impact_events = window.select_related('user', 'content_type').filter(
         action__in=['delete', 'update', 'export']
     ).order_by('-timestamp')[:20]
     
-    # User activity trends
-    daily_activity = AuditLog.objects.filter(
-        timestamp__gte=start_date
-    ).extra(
-        select={'date': 'date(timestamp)'}
-    ).values('date').annotate(count=Count('id')).order_by('date')
-    
-    # Top active users
-    top_users = AuditLog.objects.filter(
-        timestamp__gte=start_date,
-        user__isnull=False
-    ).values('user__username', 'user__first_name', 'user__last_name').annotate(
-        activity_count=Count('id')
-    ).order_by('-activity_count')[:10]
-    
-    # Content type breakdown
-    content_breakdown = AuditLog.objects.filter(
-        timestamp__gte=start_date,
-        content_type__isnull=False
-    ).values('content_type__model').annotate(count=Count('id')).order_by('-count')
-    
     context = {
-        'total_events': total_events,
-        'unique_users': unique_users,
-        'action_breakdown': action_breakdown,
+        **aggregates,
         'high_impact_events': high_impact_events,
-        'daily_activity': list(daily_activity),
-        'top_users': top_users,
-        'content_breakdown': content_breakdown,
         'time_range': time_range,
     }
     
@@ -2960,7 +3016,10 @@ def audit_logs(request):
     if date_from:
         try:
             date_from = datetime.strptime(date_from, '%Y-%m-%d').date()
-            logs = logs.filter(timestamp__date__gte=date_from)
+            # Plain range predicate on timestamp so the index can be used
+            logs = logs.filter(timestamp__gte=datetime.combine(
+                date_from, time.min, tzinfo=timezone.get_current_timezone()
+            ))
         except ValueError:
             pass
     
@@ -2968,35 +3027,65 @@ def audit_logs(request):
     if date_to:
         try:
             date_to = datetime.strptime(date_to, '%Y-%m-%d').date()
-            logs = logs.filter(timestamp__date__lte=date_to)
+            logs = logs.filter(timestamp__lt=datetime.combine(
+                date_to + timedelta(days=1), time.min, tzinfo=timezone.get_current_timezone()
+            ))
         except ValueError:
             pass
     
     search = request.GET.get('search')
     if search:
-        logs = logs.filter(
-            Q(user__username__icontains=search) |
-            Q(user__first_name__icontains=search) |
-            Q(user__last_name__icontains=search) |
-            Q(details__icontains=search)
-        )
-    
-    # Pagination
-    paginator = Paginator(logs, 100)
+        from django.contrib.auth.models import User
+        
+        if len(search) >= 3:  # trigram indexes need at least 3 characters
+            # Resolve matching users first (small table), so the log filter is an
+            # OR of two single-table predicates: the details trigram index and the
+            # user_id index can be combined instead of scanning across the join
+            user_ids = list(User.objects.filter(
+                Q(username__icontains=search) |
+                Q(first_name__icontains=search) |
+                Q(last_name__icontains=search)
+            ).values_list('id', flat=True))
+            logs = logs.filter(Q(details__icontains=search) | Q(user_id__in=user_ids))
+        else:
+            # Too short for a substring search; match the username exactly instead
+            messages.info(request, 'Search terms need at least 3 characters; showing exact username matches only.')
+            logs = logs.filter(user__username__iexact=search)
+    
+    # Pagination (total row count cached per filter combination)
+    filter_key = hashlib.md5(
+        repr(sorted((k, v) for k, v in request.GET.items() if k != 'page')).encode()
+    ).hexdigest()
+    paginator = CachedCountPaginator(logs, 100, cache_key=f'audit_count:{filter_key}')
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # Filter options for dropdowns
+    # Precomputed display fields for the rows on this page
+    for log in page_obj:
+        log.ua_display = (log.user_agent or '')[:100]
+        log.action_label = _ACTION_LABELS.get(log.action, log.action)
+    
+    # Filter options for dropdowns (cached, they change rarely)
     from django.contrib.auth.models import User
     from django.contrib.contenttypes.models import ContentType
     
-    users = User.objects.filter(
-        id__in=AuditLog.objects.values_list('user_id', flat=True).distinct()
-    ).order_by('username')
+    users = cache.get_or_set(
+        'audit_filter_users',
+        lambda: list(
+            User.objects.filter(auditlog__isnull=False)
+            .only('id', 'username').distinct().order_by('username')
+        ),
+        300
+    )
     
-    content_types = ContentType.objects.filter(
-        id__in=AuditLog.objects.values_list('content_type_id', flat=True).distinct()
-    ).order_by('model')
+    content_types = cache.get_or_set(
+        'audit_filter_content_types',
+        lambda: list(
+            ContentType.objects.filter(auditlog__isnull=False)
+            .only('id', 'app_label', 'model').distinct().order_by('model')
+        ),
+        300
+    )
     
     context = {
         'page_obj': page_obj,
@@ -3046,7 +3135,7 @@ def compliance_reports(request):
                 return redirect('compliance_reports')
     
     # Get existing reports
-    reports = ComplianceReport.objects.order_by('-created_at')
+    reports = ComplianceReport.objects.select_related('generated_by').order_by('-created_at')
     
     context = {
         'reports': reports,
@@ -3068,14 +3157,7 @@ def user_activity_report(request, user_id):
     
     # Time range filter
     time_range = request.GET.get('range', '30d')
-    if time_range == '7d':
-        start_date = timezone.now() - timedelta(days=7)
-    elif time_range == '30d':
-        start_date = timezone.now() - timedelta(days=30)
-    elif time_range == '90d':
-        start_date = timezone.now() - timedelta(days=90)
-    else:
-        start_date = timezone.now() - timedelta(days=30)
+    start_date = timezone.now() - timedelta(days=_RANGE_MAP.get(time_range, 30))
     
     activities = activities.filter(timestamp__gte=start_date)
     
@@ -3086,12 +3168,12 @@ def user_activity_report(request, user_id):
     ).order_by('-count')
     
     # Timeline data
-    daily_activity = activities.extra(
-        select={'date': 'date(timestamp)'}
+    daily_activity = activities.annotate(
+        date=TruncDate('timestamp')
     ).values('date').annotate(count=Count('id')).order_by('date')
     
     # Recent activities
-    recent_activities = activities[:50]
+    recent_activities = activities.select_related('user', 'content_type')[:50]
     
     # Suspicious patterns analysis
     analyzer = AuditAnalyzer()
@@ -3119,7 +3201,7 @@ def export_audit_data(request):
     date_to = request.GET.get('date_to')
     
     # Build query
-    logs = AuditLog.objects.select_related('user', 'content_type').order_by('-timestamp')
+    logs = AuditLog.objects.order_by('-timestamp')
     
     if date_from:
         try:
@@ -3135,40 +3217,53 @@ def export_audit_data(request):
         except ValueError:
             pass
     
+    # Project only the exported columns straight to tuples (no model instances)
+    rows = logs.annotate(
+        uname=Coalesce('user__username', Value('Anonymous')),
+        ctype=Coalesce('content_type__model', Value('')),
+        ua=Substr('user_agent', 1, 100)  # Truncate user agent server-side
+    ).values_list(
+        'id', 'timestamp', 'uname', 'action', 'ctype', 'object_id',
+        'ip_address', 'ua', 'details'
+    )
+    
     if format_type == 'csv':
         import csv
-        from django.http import HttpResponse
         
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="audit_log_{datetime.now().strftime("%Y%m%d")}.csv"'
+        writer = csv.writer(Echo())
         
-        writer = csv.writer(response)
-        writer.writerow([
-            'Timestamp', 'User', 'Action', 'Content Type', 'Object ID', 
-            'IP Address', 'User Agent', 'Details'
-        ])
-        
-        for log in logs[:10000]:  # Limit to prevent timeout
-            writer.writerow([
-                log.timestamp.isoformat(),
-                log.user.username if log.user else 'Anonymous',
-                log.get_action_display(),
-                log.content_type.model if log.content_type else '',
-                log.object_id or '',
-                log.ip_address,
-                log.user_agent[:100],  # Truncate user agent
-                json.dumps(log.details) if log.details else ''
+        def csv_rows():
+            yield writer.writerow([
+                'Timestamp', 'User', 'Action', 'Content Type', 'Object ID', 
+                'IP Address', 'User Agent', 'Details'
             ])
+            
+            # Stream in keyset-paginated batches instead of materializing the queryset
+            for _, timestamp, uname, action, ctype, object_id, ip_address, user_agent, details in _iter_keyset(rows):
+                yield writer.writerow([
+                    timestamp.isoformat(),
+                    uname,
+                    _ACTION_LABELS.get(action, action),
+                    ctype,
+                    object_id or '',
+                    ip_address,
+                    user_agent,
+                    orjson.dumps(details).decode() if details else ''
+                ])
+        
+        response = StreamingHttpResponse(csv_rows(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="audit_log_{datetime.now().strftime("%Y%m%d")}.csv"'
         
         return response
     
     elif format_type == 'excel':
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill
         
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Audit Log"
+        # Write-only mode streams rows out instead of keeping every Cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Audit Log")
         
         # Headers
         headers = [
@@ -3176,21 +3271,28 @@ def export_audit_data(request):
             'IP Address', 'User Agent', 'Details'
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        
-        # Data
-        for row, log in enumerate(logs[:10000], 2):
-            ws.cell(row=row, column=1, value=log.timestamp)
-            ws.cell(row=row, column=2, value=log.user.username if log.user else 'Anonymous')
-            ws.cell(row=row, column=3, value=log.get_action_display())
-            ws.cell(row=row, column=4, value=log.content_type.model if log.content_type else '')
-            ws.cell(row=row, column=5, value=log.object_id or '')
-            ws.cell(row=row, column=6, value=log.ip_address)
-            ws.cell(row=row, column=7, value=log.user_agent[:100])
-            ws.cell(row=row, column=8, value=json.dumps(log.details) if log.details else '')
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Data (newest rows first, capped)
+        for _, timestamp, uname, action, ctype, object_id, ip_address, user_agent, details in rows.order_by('-timestamp', '-id')[:_EXCEL_EXPORT_LIMIT]:
+            ws.append([
+                timestamp,
+                uname,
+                _ACTION_LABELS.get(action, action),
+                ctype,
+                object_id or '',
+                ip_address,
+                user_agent,
+                orjson.dumps(details).decode() if details else ''
+            ])
         
         response = HttpResponse(
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
@@ -3208,23 +3310,17 @@ class ComplianceReportGenerator:
     def generate_gdpr_report(date_from, date_to):
         """Generate GDPR compliance report"""
         
-        # Data access logs
-        data_access = AuditLog.objects.filter(
-            timestamp__range=[date_from, date_to],
-            action='read'
-        ).count()
-        
-        # Data exports
-        data_exports = AuditLog.objects.filter(
-            timestamp__range=[date_from, date_to],
-            action='export'
-        ).count()
-        
-        # Data deletions
-        data_deletions = AuditLog.objects.filter(
-            timestamp__range=[date_from, date_to],
-            action='delete'
-        ).count()
+        # Data access, export and deletion logs
+        counts = AuditLog.objects.filter(
+            timestamp__range=[date_from, date_to]
+        ).aggregate(
+            reads=Count('id', filter=Q(action='read')),
+            exports=Count('id', filter=Q(action='export')),
+            deletes=Count('id', filter=Q(action='delete'))
+        )
+        data_access = counts['reads']
+        data_exports = counts['exports']
+        data_deletions = counts['deletes']
         
         # User consent tracking (would need additional models in real implementation)
         # For now, we'll use form submissions as proxy
@@ -3252,17 +3348,15 @@ class ComplianceReportGenerator:
     def generate_hipaa_report(date_from, date_to):
         """Generate HIPAA compliance report"""
         
-        # PHI access logs
-        phi_access = AuditLog.objects.filter(
-            timestamp__range=[date_from, date_to],
-            details__contains='healthcare'  # Would be more sophisticated in real implementation
-        ).count()
-        
-        # Unauthorized access attempts
-        unauthorized_attempts = AuditLog.objects.filter(
-            timestamp__range=[date_from, date_to],
-            user__isnull=True
-        ).count()
+        # PHI access logs and unauthorized access attempts
+        counts = AuditLog.objects.filter(
+            timestamp__range=[date_from, date_to]
+        ).aggregate(
+            phi_access=Count('id', filter=Q(details__contains='healthcare')),  # Would be more sophisticated in real implementation
+            unauthorized=Count('id', filter=Q(user__isnull=True))
+        )
+        phi_access = counts['phi_access']
+        unauthorized_attempts = counts['unauthorized']
         
         return {
             'report_type': 'HIPAA Compliance',
@@ -3291,15 +3385,30 @@ class AuditAnalyzer:
         
         risk_indicators = []
         
+        # Scalar counters in one round trip
+        stats = activities.aggregate(
+            total=Count('id'),
+            after_hours=Count('id', filter=Q(timestamp__hour__in=[22, 23, 0, 1, 2, 3, 4, 5])),
+            exports=Count('id', filter=Q(action='export')),
+            distinct_ips=Count('ip_address', distinct=True)
+        )
+        
         # Unusual activity patterns
-        daily_activity = activities.extra(
-            select={'date': 'date(timestamp)'}
+        daily_activity = activities.annotate(
+            date=TruncDate('timestamp')
         ).values('date').annotate(count=Count('id'))
         
-        activity_counts = [item['count'] for item in daily_activity]
-        if activity_counts:
-            avg_activity = sum(activity_counts) / len(activity_counts)
-            max_activity = max(activity_counts)
+        # Mean and max in one pass over the per-day counts
+        active_days = activity_sum = max_activity = 0
+        for item in daily_activity:
+            count = item['count']
+            active_days += 1
+            activity_sum += count
+            if count > max_activity:
+                max_activity = count
+        
+        if active_days:
+            avg_activity = activity_sum / active_days
             
             if max_activity > avg_activity * 3:
                 risk_indicators.append({
@@ -3309,11 +3418,8 @@ class AuditAnalyzer:
                 })
         
         # After-hours activity
-        after_hours = activities.filter(
-            timestamp__hour__in=[22, 23, 0, 1, 2, 3, 4, 5]
-        ).count()
-        
-        total_activities = activities.count()
+        after_hours = stats['after_hours']
+        total_activities = stats['total']
         if total_activities > 0 and (after_hours / total_activities) > 0.2:
             risk_indicators.append({
                 'type': 'after_hours_activity',
@@ -3322,7 +3428,7 @@ class AuditAnalyzer:
             })
         
         # Bulk data exports
-        exports = activities.filter(action='export').count()
+        exports = stats['exports']
         if exports > 5:
             risk_indicators.append({
                 'type': 'bulk_exports',
@@ -3331,7 +3437,7 @@ class AuditAnalyzer:
             })
         
         # Multiple IP addresses
-        ip_addresses = activities.values('ip_address').distinct().count()
+        ip_addresses = stats['distinct_ips']
         if ip_addresses > 3:
             risk_indicators.append({
                 'type': 'multiple_ips',
@@ -3342,7 +3448,7 @@ class AuditAnalyzer:
         return risk_indicators
 
 # audit_trail/tasks.py
-@shared_task
+@shared_task(queue='cpu')
 def generate_compliance_report(report_type, date_from_str, date_to_str, user_id):
     """Generate compliance report asynchronously"""
     
@@ -3353,17 +3459,18 @@ def generate_compliance_report(report_type, date_from_str, date_to_str, user_id)
         date_from = datetime.fromisoformat(date_from_str)
         date_to = datetime.fromisoformat(date_to_str)
         
-        generator = ComplianceReportGenerator()
+        generators = {
+            'gdpr': ComplianceReportGenerator.generate_gdpr_report,
+            'hipaa': ComplianceReportGenerator.generate_hipaa_report,
+        }
         
-        if report_type == 'gdpr':
-            report_data = generator.generate_gdpr_report(date_from, date_to)
-        elif report_type == 'hipaa':
-            report_data = generator.generate_hipaa_report(date_from, date_to)
+        generate = generators.get(report_type)
+        if generate:
+            report_data = generate(date_from, date_to)
         else:
             report_data = {'error': f'Unknown report type: {report_type}'}
         
         # Save report to file
-        import json
         import os
         from django.conf import settings
         
@@ -3373,8 +3480,8 @@ def generate_compliance_report(report_type, date_from_str, date_to_str, user_id)
         filename = f"{report_type}_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         file_path = os.path.join(reports_dir, filename)
         
-        with open(file_path, 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
         
         # Create report record
         ComplianceReport.objects.create(
@@ -3389,6 +3496,193 @@ def generate_compliance_report(report_type, date_from_str, date_to_str, user_id)
     
     except Exception as e:
         return {'success': False, 'error': str(e)}
+
+@shared_task(queue='cpu', ignore_result=True)
+def refresh_audit_daily_rollups(days=2):
+    """Rebuild AuditDailyRollup rows for the last few days (scheduled hourly via celery beat)"""
+    
+    since = timezone.localdate() - timedelta(days=days - 1)
+    start = timezone.make_aware(datetime.combine(since, datetime.min.time()))
+    
+    rows = AuditLog.objects.filter(timestamp__gte=start).annotate(
+        date=TruncDate('timestamp')
+    ).values('date', 'user', 'action', 'content_type').annotate(count=Count('id'))
+    
+    with transaction.atomic():
+        AuditDailyRollup.objects.filter(date__gte=since).delete()
+        created = AuditDailyRollup.objects.bulk_create([
+            AuditDailyRollup(
+                date=row['date'],
+                user_id=row['user'],
+                action=row['action'],
+                content_type_id=row['content_type'],
+                event_count=row['count']
+            )
+            for row in rows  # one row per day/user/action/type, already aggregated
+        ], batch_size=1000)
+    
+    return {'success': True, 'since': since.isoformat(), 'rows': len(created)}
+'''
+
+# audit_trail/models.py - add alongside AuditLog
+AUDIT_TRAIL_ROLLUP_MODEL = '''
+class AuditDailyRollup(models.Model):
+    """Per-day audit event counts, materialized from AuditLog for the dashboard"""
+    
+    date = models.DateField(db_index=True)
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    action = models.CharField(max_length=20)
+    content_type = models.ForeignKey(ContentType, on_delete=models.SET_NULL, null=True, blank=True)
+    event_count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        ordering = ['-date']
+        indexes = [
+            models.Index(fields=['date', 'action'], name='audit_rollup_date_action_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.action}: {self.event_count}"
+'''
+
+# audit_trail/models.py - AuditLog.Meta, kept in step with the index migrations
+AUDIT_TRAIL_LOG_INDEXES = '''
+    class Meta:
+        indexes = [
+            models.Index(fields=['timestamp'], name='audit_ts_idx'),
+            models.Index(fields=['user', 'timestamp'], name='audit_user_ts_idx'),
+            models.Index(fields=['action', '-timestamp'], name='audit_action_ts_idx'),
+            models.Index(
+                fields=['-timestamp'],
+                name='audit_high_impact_idx',
+                condition=models.Q(action__in=['delete', 'update', 'export']),
+            ),
+        ]
+'''
+
+# audit_trail/migrations/0002_auditlog_indexes.py
+AUDIT_TRAIL_INDEX_MIGRATION = '''
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+    
+    dependencies = [
+        ('audit_trail', '0001_initial'),
+    ]
+    
+    operations = [
+        # Range scans on the dashboard / activity time windows
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['timestamp'], name='audit_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', 'timestamp'], name='audit_user_ts_idx'),
+        ),
+    ]
+'''
+
+# audit_trail/migrations/0003_auditlog_action_indexes.py
+AUDIT_TRAIL_ACTION_INDEX_MIGRATION = '''
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+    
+    dependencies = [
+        ('audit_trail', '0002_auditlog_indexes'),
+    ]
+    
+    operations = [
+        # Action breakdown and high-impact listing, newest first
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action', '-timestamp'], name='audit_action_ts_idx'),
+        ),
+        # Small partial index for the dashboard's high-impact events (PostgreSQL)
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(
+                fields=['-timestamp'],
+                name='audit_high_impact_idx',
+                condition=models.Q(action__in=['delete', 'update', 'export']),
+            ),
+        ),
+    ]
+'''
+
+# audit_trail/migrations/0004_search_trigram_indexes.py
+AUDIT_TRAIL_SEARCH_INDEX_MIGRATION = '''
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+class Migration(migrations.Migration):
+    
+    dependencies = [
+        ('audit_trail', '0003_auditlog_action_indexes'),
+    ]
+    
+    # icontains compiles to UPPER(col::text) LIKE UPPER(...), so index that expression
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS audit_details_trgm ON audit_trail_auditlog "
+                "USING GIN ((UPPER(details::text)) gin_trgm_ops);",
+            reverse_sql="DROP INDEX IF EXISTS audit_details_trgm;",
+        ),
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS auth_user_username_trgm ON auth_user "
+                "USING GIN ((UPPER(username::text)) gin_trgm_ops);",
+            reverse_sql="DROP INDEX IF EXISTS auth_user_username_trgm;",
+        ),
+    ]
+'''
+
+# audit_trail/migrations/0005_auditdailyrollup.py
+AUDIT_TRAIL_ROLLUP_MIGRATION = '''
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+class Migration(migrations.Migration):
+    
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('audit_trail', '0004_search_trigram_indexes'),
+    ]
+    
+    operations = [
+        migrations.CreateModel(
+            name='AuditDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(db_index=True)),
+                ('action', models.CharField(max_length=20)),
+                ('event_count', models.PositiveIntegerField(default=0)),
+                ('content_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='contenttypes.contenttype')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-date'],
+                'indexes': [models.Index(fields=['date', 'action'], name='audit_rollup_date_action_idx')],
+            },
+        ),
+    ]
+'''
+
+# form_platform/enterprise_settings.py - add to the Celery configuration
+AUDIT_TRAIL_BEAT_SCHEDULE = '''
+from celery.schedules import crontab
+
+CELERY_BEAT_SCHEDULE = {
+    # Keep the audit dashboard rollups current (today and yesterday)
+    'refresh-audit-daily-rollups': {
+        'task': 'audit_trail.tasks.refresh_audit_daily_rollups',
+        'schedule': crontab(minute=5),
+        'kwargs': {'days': 2},
+    },
+}
 '''
 
 # ==============================================================================
@@ -3400,9 +3694,11 @@ COMPLETE_MANAGEMENT_COMMANDS = '''
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User, Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from enterprise_security.models import SecurityEvent, APIKey
 from analytics_engine.models import AnalyticsDashboard
 from workflow_automation.models import WorkflowRule
+from collections import defaultdict
 import secrets
 
 class Command(BaseCommand):
@@ -3411,6 +3707,9 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write("🚀 Setting up enterprise features...")
         
+        # Superuser that owns the default dashboards and workflows
+        self.admin_user = User.objects.filter(is_superuser=True).only('id', 'email').first()
+        
         # Create enterprise groups with proper permissions
         self.setup_groups_and_permissions()
         
@@ -3430,55 +3729,68 @@ class Command(BaseCommand):
     def setup_groups_and_permissions(self):
         """Setup enterprise user groups with proper permissions"""
         
-        # Enterprise Admin Group
-        admin_group, created = Group.objects.get_or_create(name='Enterprise Admins')
-        if created:
-            # Add all permissions to enterprise admins
-            all_permissions = Permission.objects.all()
-            admin_group.permissions.set(all_permissions)
-            self.stdout.write("Created Enterprise Admins group")
-        
-        # Analytics Team Group
-        analytics_group, created = Group.objects.get_or_create(name='Analytics Team')
-        if created:
-            analytics_permissions = Permission.objects.filter(
-                content_type__app_label__in=['analytics_engine', 'forms_manager']
-            )
-            analytics_group.permissions.set(analytics_permissions)
-            self.stdout.write("Created Analytics Team group")
-        
-        # Security Team Group
-        security_group, created = Group.objects.get_or_create(name='Security Team')
-        if created:
-            security_permissions = Permission.objects.filter(
-                content_type__app_label__in=['enterprise_security', 'audit_trail']
-            )
-            security_group.permissions.set(security_permissions)
-            self.stdout.write("Created Security Team group")
-        
-        # Workflow Managers Group
-        workflow_group, created = Group.objects.get_or_create(name='Workflow Managers')
-        if created:
-            workflow_permissions = Permission.objects.filter(
-                content_type__app_label='workflow_automation'
-            )
-            workflow_group.permissions.set(workflow_permissions)
-            self.stdout.write("Created Workflow Managers group")
+        # Fetch every permission once and bucket the ids by app label
+        all_permission_ids = []
+        by_app = defaultdict(list)
+        for perm in Permission.objects.values('id', 'content_type__app_label'):
+            all_permission_ids.append(perm['id'])
+            by_app[perm['content_type__app_label']].append(perm['id'])
+        
+        # One transaction so all permission inserts commit together
+        with transaction.atomic():
+            # Enterprise Admin Group
+            admin_group, created = Group.objects.get_or_create(name='Enterprise Admins')
+            if created:
+                # Add all permissions to enterprise admins
+                self.assign_permissions(admin_group, all_permission_ids)
+                self.stdout.write("Created Enterprise Admins group")
+            
+            # Analytics Team Group
+            analytics_group, created = Group.objects.get_or_create(name='Analytics Team')
+            if created:
+                self.assign_permissions(
+                    analytics_group, by_app['analytics_engine'] + by_app['forms_manager']
+                )
+                self.stdout.write("Created Analytics Team group")
+            
+            # Security Team Group
+            security_group, created = Group.objects.get_or_create(name='Security Team')
+            if created:
+                self.assign_permissions(
+                    security_group, by_app['enterprise_security'] + by_app['audit_trail']
+                )
+                self.stdout.write("Created Security Team group")
+            
+            # Workflow Managers Group
+            workflow_group, created = Group.objects.get_or_create(name='Workflow Managers')
+            if created:
+                self.assign_permissions(workflow_group, by_app['workflow_automation'])
+                self.stdout.write("Created Workflow Managers group")
+
+    def assign_permissions(self, group, permission_ids):
+        """Insert all group/permission rows with a single bulk INSERT"""
+        
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create(
+            [GroupPermission(group_id=group.id, permission_id=pid) for pid in permission_ids],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
 
     def setup_default_dashboards(self):
         """Create default analytics dashboards"""
         
-        admin_user = User.objects.filter(is_superuser=True).first()
+        admin_user = self.admin_user
         if not admin_user:
             self.stdout.write(self.style.WARNING("No superuser found, skipping dashboard creation"))
             return
         
-        # Executive Dashboard
-        exec_dashboard, created = AnalyticsDashboard.objects.get_or_create(
-            name='Executive Dashboard',
-            defaults={
-                'description': 'High-level metrics for executives and managers',
-                'config': {
+        dashboards = [
+            # Executive Dashboard
+            AnalyticsDashboard(
+                name='Executive Dashboard',
+                description='High-level metrics for executives and managers',
+                config={
                     'widgets': [
                         'submission_trends',
                         'conversion_rates', 
@@ -3488,19 +3800,14 @@ class Command(BaseCommand):
                     'refresh_interval': 300,
                     'layout': 'executive'
                 },
-                'owner': admin_user,
-                'is_public': True
-            }
-        )
-        if created:
-            self.stdout.write("Created Executive Dashboard")
-        
-        # Operations Dashboard
-        ops_dashboard, created = AnalyticsDashboard.objects.get_or_create(
-            name='Operations Dashboard',
-            defaults={
-                'description': 'Operational metrics for day-to-day management',
-                'config': {
+                owner=admin_user,
+                is_public=True
+            ),
+            # Operations Dashboard
+            AnalyticsDashboard(
+                name='Operations Dashboard',
+                description='Operational metrics for day-to-day management',
+                config={
                     'widgets': [
                         'form_performance',
                         'user_engagement',
@@ -3510,19 +3817,14 @@ class Command(BaseCommand):
                     'refresh_interval': 120,
                     'layout': 'operations'
                 },
-                'owner': admin_user,
-                'is_public': True
-            }
-        )
-        if created:
-            self.stdout.write("Created Operations Dashboard")
-        
-        # Security Dashboard
-        security_dashboard, created = AnalyticsDashboard.objects.get_or_create(
-            name='Security Monitoring',
-            defaults={
-                'description': 'Security events and threat monitoring',
-                'config': {
+                owner=admin_user,
+                is_public=True
+            ),
+            # Security Dashboard
+            AnalyticsDashboard(
+                name='Security Monitoring',
+                description='Security events and threat monitoring',
+                config={
                     'widgets': [
                         'security_events',
                         'failed_logins',
@@ -3532,85 +3834,141 @@ class Command(BaseCommand):
                     'refresh_interval': 60,
                     'layout': 'security'
                 },
-                'owner': admin_user,
-                'is_public': False
-            }
-        )
-        if created:
-            self.stdout.write("Created Security Dashboard")
+                owner=admin_user,
+                is_public=False
+            ),
+        ]
+        
+        for dashboard in self.create_missing(AnalyticsDashboard, dashboards):
+            self.stdout.write(f"Created {dashboard.name}")
 
     def setup_sample_workflows(self):
         """Create sample workflow rules"""
         
-        admin_user = User.objects.filter(is_superuser=True).first()
+        admin_user = self.admin_user
         if not admin_user:
             return
         
-        # Auto-approval workflow
-        auto_approval, created = WorkflowRule.objects.get_or_create(
-            name='Auto-approve simple forms',
-            defaults={
-                'description': 'Automatically approve forms that meet basic criteria',
-                'trigger_type': 'form_submitted',
-                'trigger_conditions': {
+        workflows = [
+            # Auto-approval workflow
+            WorkflowRule(
+                name='Auto-approve simple forms',
+                description='Automatically approve forms that meet basic criteria',
+                trigger_type='form_submitted',
+                trigger_conditions={
                     'form_complexity': 'simple',
                     'user_trust_score': 'high'
                 },
-                'action_type': 'update_status',
-                'action_config': {
+                action_type='update_status',
+                action_config={
                     'new_status': 'approved'
                 },
-                'created_by': admin_user
-            }
-        )
-        if created:
-            self.stdout.write("Created auto-approval workflow")
-        
-        # Notification workflow
-        notification, created = WorkflowRule.objects.get_or_create(
-            name='Notify on high-priority submissions',
-            defaults={
-                'description': 'Send notifications for high-priority form submissions',
-                'trigger_type': 'form_submitted',
-                'trigger_conditions': {
+                created_by=admin_user
+            ),
+            # Notification workflow
+            WorkflowRule(
+                name='Notify on high-priority submissions',
+                description='Send notifications for high-priority form submissions',
+                trigger_type='form_submitted',
+                trigger_conditions={
                     'priority': 'high'
                 },
-                'action_type': 'send_email',
-                'action_config': {
+                action_type='send_email',
+                action_config={
                     'recipients': [admin_user.email],
                     'subject': 'High-Priority Form Submission',
                     'template': 'workflow/high_priority_notification.html'
                 },
-                'created_by': admin_user
-            }
+                created_by=admin_user
+            ),
+        ]
+        
+        for workflow in self.create_missing(WorkflowRule, workflows):
+            self.stdout.write(f"Created workflow: {workflow.name}")
+
+    def create_missing(self, model, instances):
+        """Bulk-insert the instances whose name doesn't exist yet; returns the created ones"""
+        
+        existing = set(
+            model.objects.filter(
+                name__in=[obj.name for obj in instances]
+            ).values_list('name', flat=True)
         )
-        if created:
-            self.stdout.write("Created notification workflow")
+        missing = [obj for obj in instances if obj.name not in existing]
+        if missing:
+            model.objects.bulk_create(missing)
+        return missing
 
     def setup_security_monitoring(self):
         """Initialize security monitoring"""
         
         # Create initial security event for testing
-        SecurityEvent.objects.get_or_create(
-            event_type='login_attempt',
-            defaults={
-                'severity': 'low',
-                'ip_address': '127.0.0.1',
-                'user_agent': 'Django Management Command',
-                'details': {'message': 'Security monitoring initialized'},
-                'resolved': True
-            }
+        initial_events = [
+            SecurityEvent(
+                event_type='login_attempt',
+                severity='low',
+                ip_address='127.0.0.1',
+                user_agent='Django Management Command',
+                details={'message': 'Security monitoring initialized'},
+                resolved=True
+            ),
+        ]
+        existing_types = set(
+            SecurityEvent.objects.filter(
+                event_type__in=[event.event_type for event in initial_events]
+            ).values_list('event_type', flat=True)
+        )
+        SecurityEvent.objects.bulk_create(
+            [event for event in initial_events if event.event_type not in existing_types],
+            batch_size=1000,
+            ignore_conflicts=True
         )
         
         self.stdout.write("Initialized security monitoring")
 
 # management/commands/run_diagnostics.py
 from django.core.management.base import BaseCommand
-from django.db import connection
+from django.db import connection, connections
 from django.core.cache import cache
 from django.conf import settings
-import redis
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
+import subprocess
+
+def _dir_size(path):
+    """Total size in bytes of regular files under path, reusing scandir's cached stat"""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _dir_size(entry.path)
+    return total
+
+def _media_size(path):
+    """Approximate size in bytes via du(1), falling back to the Python walker"""
+    try:
+        result = subprocess.run(
+            ['du', '-sb', path], capture_output=True, text=True, timeout=5, check=True
+        )
+        return int(result.stdout.split()[0])
+    except (OSError, subprocess.SubprocessError, ValueError, IndexError):
+        return _dir_size(path)
+
+# (setting, default, predicate flagging a problem, message)
+SECURITY_CHECKS = [
+    ('DEBUG', True, lambda value: value, 'DEBUG is enabled in production'),
+    ('SECRET_KEY', '', lambda value: 'django-insecure' in value, 'Using default insecure SECRET_KEY'),
+    ('SECURE_SSL_REDIRECT', False, lambda value: not value, 'HTTPS redirect not configured'),
+]
+
+@lru_cache(maxsize=1)
+def _get_redis_client():
+    """Shared Redis client; redis is imported lazily to keep command startup light"""
+    import redis
+    return redis.Redis.from_url(getattr(settings, 'REDIS_URL', 'redis://localhost:6379/0'))
 
 class Command(BaseCommand):
     help = 'Run comprehensive system diagnostics'
@@ -3618,38 +3976,53 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write("🔍 Running Enterprise System Diagnostics...")
         
-        diagnostics = {
-            'database': self.check_database(),
-            'cache': self.check_cache(),
-            'redis': self.check_redis(),
-            'celery': self.check_celery(),
-            'storage': self.check_storage(),
-            'security': self.check_security(),
-            'integrations': self.check_integrations()
-        }
+        checks = [
+            ('database', self.check_database),
+            ('cache', self.check_cache),
+            ('redis', self.check_redis),
+            ('celery', self.check_celery),
+            ('storage', self.check_storage),
+            ('security', self.check_security),
+            ('integrations', self.check_integrations),
+        ]
+        
+        # Checks hit independent subsystems, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(self.run_check, check) for name, check in checks}
+            diagnostics = {name: future.result() for name, future in futures.items()}
         
         # Display results
         self.display_results(diagnostics)
         
         # Overall health score
         health_score = self.calculate_health_score(diagnostics)
-        self.stdout.write(f"\n🏥 Overall System Health: {health_score}%")
+        self.stdout.write(f"\\n🏥 Overall System Health: {health_score}%")
+
+    def run_check(self, check):
+        """Run a check on a worker thread and release that thread's DB connections"""
+        try:
+            return check()
+        finally:
+            connections.close_all()
 
     def check_database(self):
         """Check database connectivity and performance"""
         try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-            
-            # Check table counts
             from apps.forms_manager.models import Form, FormSubmission
             from django.contrib.auth.models import User
             
+            # Connectivity check and table counts in a single round trip
+            tables = [connection.ops.quote_name(model._meta.db_table) for model in (Form, FormSubmission, User)]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in tables)
+                )
+                forms, submissions, users = cursor.fetchone()
+            
             stats = {
-                'forms': Form.objects.count(),
-                'submissions': FormSubmission.objects.count(),
-                'users': User.objects.count()
+                'forms': forms,
+                'submissions': submissions,
+                'users': users
             }
             
             return {
@@ -3688,10 +4061,11 @@ class Command(BaseCommand):
     def check_redis(self):
         """Check Redis connectivity"""
         try:
-            redis_client = redis.Redis.from_url(getattr(settings, 'REDIS_URL', 'redis://localhost:6379/0'))
-            redis_client.ping()
-            
-            info = redis_client.info()
+            # PING and INFO in a single round trip
+            pipe = _get_redis_client().pipeline(transaction=False)
+            pipe.ping()
+            pipe.info()
+            pong, info = pipe.execute()
             return {
                 'status': 'healthy',
                 'message': 'Redis connection successful',
@@ -3711,9 +4085,11 @@ class Command(BaseCommand):
         try:
             from celery import current_app
             
-            # Get active workers
-            inspect = current_app.control.inspect()
-            active_workers = inspect.active()
+            # Get active workers (broadcast is slow, so reuse a recent answer)
+            active_workers = cache.get('diag:celery_active')
+            if active_workers is None:
+                active_workers = current_app.control.inspect(timeout=0.3).active() or {}
+                cache.set('diag:celery_active', active_workers, 30)
             
             if active_workers:
                 worker_count = len(active_workers)
@@ -3739,11 +4115,10 @@ class Command(BaseCommand):
             # Check media directory
             media_root = getattr(settings, 'MEDIA_ROOT', '')
             if media_root and os.path.exists(media_root):
-                media_size = sum(
-                    os.path.getsize(os.path.join(dirpath, filename))
-                    for dirpath, dirnames, filenames in os.walk(media_root)
-                    for filename in filenames
-                ) / (1024 * 1024)  # MB
+                size_bytes = cache.get_or_set(
+                    'diagnostics:media_size', lambda: _media_size(media_root), 60
+                )
+                media_size = size_bytes / (1024 * 1024)  # MB
                 
                 return {
                     'status': 'healthy',
@@ -3767,20 +4142,11 @@ class Command(BaseCommand):
     def check_security(self):
         """Check security configuration"""
         try:
-            issues = []
-            
-            # Check DEBUG setting
-            if getattr(settings, 'DEBUG', True):
-                issues.append('DEBUG is enabled in production')
-            
-            # Check SECRET_KEY
-            secret_key = getattr(settings, 'SECRET_KEY', '')
-            if 'django-insecure' in secret_key:
-                issues.append('Using default insecure SECRET_KEY')
-            
-            # Check HTTPS settings
-            if not getattr(settings, 'SECURE_SSL_REDIRECT', False):
-                issues.append('HTTPS redirect not configured')
+            issues = [
+                message
+                for name, default, is_problem, message in SECURITY_CHECKS
+                if is_problem(getattr(settings, name, default))
+            ]
             
             if issues:
                 return {
@@ -3803,10 +4169,14 @@ class Command(BaseCommand):
         """Check external integrations"""
         try:
             from integration_hub.models import Integration
+            from django.db.models import Count, Q
             
-            integrations = Integration.objects.filter(is_active=True)
-            total_integrations = integrations.count()
-            failed_integrations = integrations.filter(sync_status='error').count()
+            counts = Integration.objects.filter(is_active=True).aggregate(
+                total=Count('id'),
+                failed=Count('id', filter=Q(sync_status='error'))
+            )
+            total_integrations = counts['total']
+            failed_integrations = counts['failed']
             
             if total_integrations == 0:
                 return {
@@ -3839,19 +4209,23 @@ class Command(BaseCommand):
             'info': 'ℹ️'
         }
         
+        # Build the whole report and write it once
+        lines = []
         for component, result in diagnostics.items():
             status = result['status']
             icon = status_icons.get(status, '❓')
             
-            self.stdout.write(f"\n{icon} {component.upper()}: {result['message']}")
+            lines.append(f"\\n{icon} {component.upper()}: {result['message']}")
             
             if 'stats' in result:
                 for key, value in result['stats'].items():
-                    self.stdout.write(f"   {key}: {value}")
+                    lines.append(f"   {key}: {value}")
             
             if 'issues' in result:
                 for issue in result['issues']:
-                    self.stdout.write(f"   - {issue}")
+                    lines.append(f"   - {issue}")
+        
+        self.stdout.write("\\n".join(lines))
 
     def calculate_health_score(self, diagnostics):
         """Calculate overall system health score"""
@@ -3869,9 +4243,12 @@ from django.core.management.base import BaseCommand
 from django.core.management import call_command
 from django.conf import settings
 import os
+import glob
+import gzip
 import shutil
 import datetime
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 class Command(BaseCommand):
     help = 'Create comprehensive system backup'
@@ -3883,9 +4260,16 @@ class Command(BaseCommand):
             default='/backups',
             help='Backup directory path'
         )
+        parser.add_argument(
+            '--keep-media-snapshots',
+            type=int,
+            default=7,
+            help='Number of media snapshots to keep'
+        )
 
     def handle(self, *args, **options):
         backup_dir = options['backup_dir']
+        self.keep_media_snapshots = options['keep_media_snapshots']
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = os.path.join(backup_dir, f'enterprise_backup_{timestamp}')
         
@@ -3894,17 +4278,16 @@ class Command(BaseCommand):
         # Create backup directory
         os.makedirs(backup_path, exist_ok=True)
         
-        # Database backup
-        self.backup_database(backup_path)
-        
-        # Media files backup
-        self.backup_media_files(backup_path)
-        
-        # Configuration backup
-        self.backup_configuration(backup_path)
-        
-        # Logs backup
-        self.backup_logs(backup_path)
+        # Database, media, configuration and logs are independent; run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.backup_database, backup_path),
+                executor.submit(self.backup_media_files, backup_path),
+                executor.submit(self.backup_configuration, backup_path),
+                executor.submit(self.backup_logs, backup_path),
+            ]
+            for future in futures:
+                future.result()
         
         # Create backup manifest
         self.create_manifest(backup_path)
@@ -3920,10 +4303,26 @@ class Command(BaseCommand):
         """Backup database"""
         self.stdout.write("Backing up database...")
         
-        db_backup_path = os.path.join(backup_path, 'database.json')
-        
-        with open(db_backup_path, 'w') as f:
-            call_command('dumpdata', stdout=f, format='json', indent=2)
+        db = settings.DATABASES['default']
+        if 'postgresql' in db['ENGINE']:
+            # Native custom-format dump (already compressed), bypasses the ORM.
+            # pg_dump can't run through the transaction-mode pooler, so it
+            # connects to Postgres directly when BACKUP_DB_HOST is set
+            command = [
+                'pg_dump', '-Fc', '-Z', '1',
+                '-f', os.path.join(backup_path, 'database.dump'),
+                '-h', os.environ.get('BACKUP_DB_HOST') or db.get('HOST') or 'localhost',
+                '-p', str(os.environ.get('BACKUP_DB_PORT') or db.get('PORT') or 5432),
+                '-U', db['USER'],
+                '-d', db['NAME'],
+            ]
+            subprocess.run(command, env={**os.environ, 'PGPASSWORD': db.get('PASSWORD', '')}, check=True)
+        else:
+            db_backup_path = os.path.join(backup_path, 'database.json.gz')
+            
+            # Compress while dumping; level 1 keeps CPU cost low on large JSON
+            with gzip.open(db_backup_path, 'wt', compresslevel=1) as f:
+                call_command('dumpdata', stdout=f, format='json')
         
         self.stdout.write("✅ Database backup completed")
 
@@ -3933,9 +4332,32 @@ class Command(BaseCommand):
         
         media_root = getattr(settings, 'MEDIA_ROOT', '')
         if media_root and os.path.exists(media_root):
-            media_backup_path = os.path.join(backup_path, 'media')
-            shutil.copytree(media_root, media_backup_path)
-            self.stdout.write("✅ Media files backup completed")
+            # Media is kept as hard-linked snapshots next to the archives, so
+            # unchanged files are linked against the previous snapshot, not copied.
+            # Paths are absolute: rsync resolves a relative --link-dest against the destination
+            snapshots_dir = os.path.abspath(os.path.join(os.path.dirname(backup_path), 'media_snapshots'))
+            os.makedirs(snapshots_dir, exist_ok=True)
+            previous = sorted(glob.glob(os.path.join(snapshots_dir, 'enterprise_backup_*')))
+            media_backup_path = os.path.join(snapshots_dir, os.path.basename(backup_path))
+            
+            command = ['rsync', '-a']
+            if previous:
+                command += ['--link-dest', previous[-1]]
+            command += [media_root.rstrip('/') + '/', media_backup_path + '/']
+            
+            try:
+                subprocess.run(command, check=True)
+            except FileNotFoundError:
+                # rsync not installed
+                shutil.copytree(media_root, media_backup_path)
+            
+            # Drop the oldest snapshots beyond the retention count (always keep this one)
+            snapshots = sorted(glob.glob(os.path.join(snapshots_dir, 'enterprise_backup_*')))
+            for old_snapshot in snapshots[:-max(self.keep_media_snapshots, 1)]:
+                shutil.rmtree(old_snapshot)
+            
+            self.media_snapshot_path = media_backup_path
+            self.stdout.write(f"✅ Media files backup completed ({media_backup_path})")
         else:
             self.stdout.write("⚠️  No media files to backup")
 
@@ -3985,7 +4407,8 @@ class Command(BaseCommand):
                 'media_files',
                 'configuration',
                 'logs'
-            ]
+            ],
+            'media_snapshot': getattr(self, 'media_snapshot_path', None)
         }
         
         manifest_path = os.path.join(backup_path, 'manifest.json')
@@ -3997,10 +4420,75 @@ class Command(BaseCommand):
         """Compress backup directory"""
         self.stdout.write("Compressing backup...")
         
-        shutil.make_archive(backup_path, 'gztar', backup_path)
+        if shutil.which('pigz'):
+            # Parallel gzip across all cores: tar | pigz > backup.tar.gz
+            with open(f'{backup_path}.tar.gz', 'wb') as archive:
+                tar = subprocess.Popen(
+                    ['tar', '-C', backup_path, '-cf', '-', '.'],
+                    stdout=subprocess.PIPE
+                )
+                pigz = subprocess.Popen(
+                    ['pigz', '-p', str(os.cpu_count() or 1), '-1'],
+                    stdin=tar.stdout, stdout=archive
+                )
+                tar.stdout.close()
+                if pigz.wait() != 0 or tar.wait() != 0:
+                    raise subprocess.CalledProcessError(1, 'tar | pigz')
+        else:
+            shutil.make_archive(backup_path, 'gztar', backup_path)
         shutil.rmtree(backup_path)  # Remove uncompressed directory
         
         self.stdout.write("✅ Backup compressed")
+
+# management/commands/bootstrap_deploy.py
+from django.core.management.base import BaseCommand
+from django.core.management import call_command
+from django.contrib.auth.models import User
+from audit_trail.models import AuditDailyRollup
+
+class Command(BaseCommand):
+    help = 'Run all post-deploy steps (migrate, superuser, enterprise setup) in one process'
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Bootstrapping deployment...")
+        
+        call_command('migrate', interactive=False)
+        
+        # Create superuser if it doesn't exist
+        if not User.objects.filter(username='admin').exists():
+            User.objects.create_superuser('admin', 'admin@enterprise.com', 'enterprise123!')
+            self.stdout.write("Superuser created: admin / enterprise123!")
+        
+        call_command('setup_enterprise')
+        
+        # First deploy: build the dashboard rollups for the whole 90-day range
+        if not AuditDailyRollup.objects.exists():
+            call_command('backfill_audit_rollups')
+        
+        self.stdout.write(
+            self.style.SUCCESS('✅ Deployment bootstrap completed!')
+        )
+
+# management/commands/backfill_audit_rollups.py
+from django.core.management.base import BaseCommand
+from audit_trail.tasks import refresh_audit_daily_rollups
+
+class Command(BaseCommand):
+    help = 'Rebuild AuditDailyRollup rows for the dashboard (runs the rollup task synchronously)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=120,
+            help='Number of days to rebuild, counting back from today'
+        )
+
+    def handle(self, *args, **options):
+        result = refresh_audit_daily_rollups(days=options['days'])
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Rebuilt {result['rows']} rollup rows since {result['since']}")
+        )
 '''
 
 print("✅ PART 3 COMPLETE: Integration Hub, Audit Trail, Management Commands")
@@ -4010,16 +4498,39 @@ print("📝 Final Step: Production Configuration and Testing Suite")
 # PRODUCTION DEPLOYMENT CONFIGURATION
 # ==============================================================================
 
+# form_platform/celery.py - add before the Celery app is created
+CELERY_GEVENT_PATCH = '''
+import os
+
+# The gevent pool patches Python sockets, but psycopg2 does its I/O in C;
+# without this every query blocks the whole hub (requires psycogreen)
+if os.environ.get('CELERY_POOL') == 'gevent':
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+'''
+
+# form_platform/enterprise_settings.py - database settings behind PgBouncer
+ENTERPRISE_DATABASE_SETTINGS = '''
+# PgBouncer pools in transaction mode, so a cursor can't outlive its
+# transaction; keep Django from declaring server-side cursors
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+'''
+
 # docker-compose.production.yml
 PRODUCTION_DOCKER_COMPOSE = '''
 version: '3.8'
 
 services:
   nginx:
-    image: nginx:alpine
+    image: fholzer/nginx-brotli:latest
     ports:
       - "80:80"
       - "443:443"
+      - "443:443/udp"
+    ulimits:
+      nofile:
+        soft: 65535
+        hard: 65535
     volumes:
       - ./nginx/nginx.conf:/etc/nginx/nginx.conf:ro
       - ./nginx/ssl:/etc/nginx/ssl:ro
@@ -4032,9 +4543,11 @@ services:
       - app-network
 
   web:
+    image: form-platform:latest
     build:
       context: .
       dockerfile: Dockerfile.production
+    shm_size: 512mb
     expose:
       - "8000"
     volumes:
@@ -4043,9 +4556,23 @@ services:
       - ./logs:/app/logs
     env_file:
       - .env.production
+    environment:
+      DB_HOST: pgbouncer
+      DB_PORT: 6432
+      BACKUP_DB_HOST: db
+      BACKUP_DB_PORT: 5432
+      REDIS_URL: redis://:${REDIS_PASSWORD}@redis-cache:6379/0
+      CELERY_BROKER_URL: redis://:${REDIS_PASSWORD}@redis-broker:6379/0
+      GUNICORN_WORKERS: 9
     depends_on:
-      - db
-      - redis
+      db:
+        condition: service_healthy
+      pgbouncer:
+        condition: service_started
+      redis-cache:
+        condition: service_healthy
+      redis-broker:
+        condition: service_healthy
     restart: unless-stopped
     networks:
       - app-network
@@ -4055,12 +4582,34 @@ services:
       timeout: 10s
       retries: 3
       start_period: 40s
+      start_interval: 2s
 
   db:
     image: postgres:15-alpine
+    command: >
+      postgres
+      -c max_connections=200
+      -c shared_buffers=1024MB
+      -c work_mem=64MB
+      -c maintenance_work_mem=128MB
+      -c effective_cache_size=2048MB
+      -c wal_buffers=16MB
+      -c max_wal_size=4GB
+      -c checkpoint_timeout=30min
+      -c checkpoint_completion_target=0.9
+      -c bgwriter_lru_maxpages=5000
+      -c bgwriter_delay=20ms
+      -c random_page_cost=2.0
+      -c default_statistics_target=100
+      -c shared_preload_libraries=pg_stat_statements
+      -c pg_stat_statements.track=all
+    shm_size: 256mb
+    tmpfs:
+      - /var/run/postgresql:size=128m
     volumes:
       - postgres_data:/var/lib/postgresql/data/
       - ./backups:/backups
+      - ./postgres/init:/docker-entrypoint-initdb.d:ro
     environment:
       POSTGRES_DB: ${DB_NAME}
       POSTGRES_USER: ${DB_USER}
@@ -4071,36 +4620,135 @@ services:
     healthcheck:
       test: ["CMD-SHELL", "pg_isready -U ${DB_USER}"]
       interval: 10s
+      timeout: 3s
+      retries: 5
+      start_period: 30s
+      start_interval: 2s
+
+  pgbouncer:
+    image: bitnami/pgbouncer:latest
+    environment:
+      POSTGRESQL_HOST: db
+      POSTGRESQL_PORT: 5432
+      POSTGRESQL_USERNAME: ${DB_USER}
+      POSTGRESQL_PASSWORD: ${DB_PASSWORD}
+      POSTGRESQL_DATABASE: ${DB_NAME}
+      PGBOUNCER_DATABASE: ${DB_NAME}
+      PGBOUNCER_PORT: 6432
+      PGBOUNCER_POOL_MODE: transaction
+      PGBOUNCER_MAX_CLIENT_CONN: 1000
+      PGBOUNCER_DEFAULT_POOL_SIZE: 50
+      PGBOUNCER_IGNORE_STARTUP_PARAMETERS: extra_float_digits
+    expose:
+      - "6432"
+    depends_on:
+      db:
+        condition: service_healthy
+    restart: unless-stopped
+    networks:
+      - app-network
+    healthcheck:
+      test: ["CMD-SHELL", "PGPASSWORD=${DB_PASSWORD} psql -h localhost -p 6432 -U ${DB_USER} pgbouncer -c 'SHOW POOLS'"]
+      interval: 10s
+      timeout: 5s
+      retries: 5
+
+  # Cache-only Redis: bounded memory, LRU eviction, no persistence
+  redis-cache:
+    image: redis:7-alpine
+    command: redis-server --maxmemory 512mb --maxmemory-policy allkeys-lru --save "" --appendonly no --requirepass ${REDIS_PASSWORD}
+    environment:
+      REDIS_PASSWORD: ${REDIS_PASSWORD}
+    restart: unless-stopped
+    networks:
+      - app-network
+    healthcheck:
+      test: ["CMD-SHELL", "redis-cli -a \\"$$REDIS_PASSWORD\\" --no-auth-warning ping | grep -q PONG"]
+      interval: 10s
       timeout: 5s
       retries: 5
+      start_period: 10s
+      start_interval: 2s
 
-  redis:
+  # Celery broker keeps AOF so queued tasks survive restarts
+  redis-broker:
     image: redis:7-alpine
-    command: redis-server --appendonly yes --requirepass ${REDIS_PASSWORD}
+    command: redis-server --appendonly yes --maxmemory-policy noeviction --requirepass ${REDIS_PASSWORD}
     volumes:
       - redis_data:/data
+    environment:
+      REDIS_PASSWORD: ${REDIS_PASSWORD}
     restart: unless-stopped
     networks:
       - app-network
     healthcheck:
-      test: ["CMD", "redis-cli", "ping"]
+      test: ["CMD-SHELL", "redis-cli -a \\"$$REDIS_PASSWORD\\" --no-auth-warning ping | grep -q PONG"]
       interval: 10s
       timeout: 5s
       retries: 5
+      start_period: 10s
+      start_interval: 2s
 
   celery-worker:
-    build:
-      context: .
-      dockerfile: Dockerfile.production
-    command: celery -A form_platform worker -l info --concurrency=4
+    image: form-platform:latest
+    shm_size: 512mb
+    command: celery -A form_platform worker -l info -Q celery -P gevent -c 200 --prefetch-multiplier=1
     volumes:
       - media_volume:/app/media
       - ./logs:/app/logs
     env_file:
       - .env.production
+    environment:
+      DB_HOST: pgbouncer
+      DB_PORT: 6432
+      BACKUP_DB_HOST: db
+      BACKUP_DB_PORT: 5432
+      REDIS_URL: redis://:${REDIS_PASSWORD}@redis-cache:6379/0
+      CELERY_BROKER_URL: redis://:${REDIS_PASSWORD}@redis-broker:6379/0
+      CELERY_POOL: gevent
     depends_on:
-      - db
-      - redis
+      db:
+        condition: service_healthy
+      pgbouncer:
+        condition: service_started
+      redis-cache:
+        condition: service_healthy
+      redis-broker:
+        condition: service_healthy
+    restart: unless-stopped
+    networks:
+      - app-network
+    healthcheck:
+      test: ["CMD", "celery", "-A", "form_platform", "inspect", "ping"]
+      interval: 30s
+      timeout: 10s
+      retries: 3
+
+  celery-worker-cpu:
+    image: form-platform:latest
+    shm_size: 512mb
+    command: celery -A form_platform worker -l info -Q cpu -P prefork -c 4 --prefetch-multiplier=1
+    volumes:
+      - media_volume:/app/media
+      - ./logs:/app/logs
+    env_file:
+      - .env.production
+    environment:
+      DB_HOST: pgbouncer
+      DB_PORT: 6432
+      BACKUP_DB_HOST: db
+      BACKUP_DB_PORT: 5432
+      REDIS_URL: redis://:${REDIS_PASSWORD}@redis-cache:6379/0
+      CELERY_BROKER_URL: redis://:${REDIS_PASSWORD}@redis-broker:6379/0
+    depends_on:
+      db:
+        condition: service_healthy
+      pgbouncer:
+        condition: service_started
+      redis-cache:
+        condition: service_healthy
+      redis-broker:
+        condition: service_healthy
     restart: unless-stopped
     networks:
       - app-network
@@ -4111,17 +4759,29 @@ services:
       retries: 3
 
   celery-beat:
-    build:
-      context: .
-      dockerfile: Dockerfile.production
+    image: form-platform:latest
+    shm_size: 512mb
     command: celery -A form_platform beat -l info
     volumes:
       - ./logs:/app/logs
     env_file:
       - .env.production
+    environment:
+      DB_HOST: pgbouncer
+      DB_PORT: 6432
+      BACKUP_DB_HOST: db
+      BACKUP_DB_PORT: 5432
+      REDIS_URL: redis://:${REDIS_PASSWORD}@redis-cache:6379/0
+      CELERY_BROKER_URL: redis://:${REDIS_PASSWORD}@redis-broker:6379/0
     depends_on:
-      - db
-      - redis
+      db:
+        condition: service_healthy
+      pgbouncer:
+        condition: service_started
+      redis-cache:
+        condition: service_healthy
+      redis-broker:
+        condition: service_healthy
     restart: unless-stopped
     networks:
       - app-network
@@ -4161,7 +4821,13 @@ services:
     environment:
       - discovery.type=single-node
       - xpack.security.enabled=false
-      - "ES_JAVA_OPTS=-Xms512m -Xmx512m"
+      - bootstrap.memory_lock=true
+      - indices.memory.index_buffer_size=30%
+      - "ES_JAVA_OPTS=-Xms2g -Xmx2g -XX:+UseG1GC"
+    ulimits:
+      memlock:
+        soft: -1
+        hard: -1
     volumes:
       - elasticsearch_data:/usr/share/elasticsearch/data
     ports:
@@ -4207,8 +4873,42 @@ networks:
     driver: bridge
 '''
 
+# postgres/init/01-pg-stat-statements.sql
+POSTGRES_INIT_SQL = '''
+CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
+'''
+
 # Dockerfile.production
 PRODUCTION_DOCKERFILE = '''
+# syntax=docker/dockerfile:1.6
+
+# Build stage: compile wheels with the toolchain, keep it out of the runtime image
+FROM python:3.11-slim AS builder
+
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    build-essential \\
+    libpq-dev \\
+    && rm -rf /var/lib/apt/lists/*
+
+COPY requirements.txt /tmp/
+RUN --mount=type=cache,target=/root/.cache/pip \\
+    pip install --prefix=/install -r /tmp/requirements.txt
+
+# Static stage: collect hashed assets and pre-compress them for gzip_static/brotli_static
+FROM builder AS static
+
+RUN apt-get update && apt-get install -y --no-install-recommends brotli \\
+    && rm -rf /var/lib/apt/lists/*
+RUN cp -a /install/. /usr/local/
+
+ENV DJANGO_SETTINGS_MODULE=form_platform.enterprise_settings
+WORKDIR /app
+COPY . /app/
+RUN python manage.py collectstatic --noinput --clear && \\
+    find staticfiles -type f \\( -name '*.js' -o -name '*.css' -o -name '*.svg' \\) \\
+        -exec gzip -9kf {} \\; -exec brotli -q 11 -kf {} \\;
+
+# Runtime stage
 FROM python:3.11-slim
 
 # Set environment variables
@@ -4216,11 +4916,12 @@ ENV PYTHONDONTWRITEBYTECODE=1
 ENV PYTHONUNBUFFERED=1
 ENV DJANGO_SETTINGS_MODULE=form_platform.enterprise_settings
 
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
-    build-essential \\
-    libpq-dev \\
-    gettext \\
+# Install runtime system dependencies only
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    libpq5 \\
+    postgresql-client-15 \\
+    rsync \\
+    pigz \\
     curl \\
     clamav \\
     clamav-daemon \\
@@ -4230,47 +4931,97 @@ RUN apt-get update && apt-get install -y \\
 # Create app directory
 WORKDIR /app
 
-# Install Python dependencies
-COPY requirements.txt /app/
-RUN pip install --no-cache-dir -r requirements.txt
+# Install Python dependencies from the builder stage
+COPY --from=builder /install /usr/local
 
 # Copy application code
 COPY . /app/
 
+# Collected, pre-compressed static assets from the static stage; kept out of the
+# static_volume mount point and synced into it on every start (see CMD)
+COPY --from=static /app/staticfiles /app/static-build
+
+# Pre-compile bytecode so containers don't pay the .py -> .pyc cost on first import
+RUN python -m compileall -q -j 0 /app && \\
+    python -O -m compileall -q -j 0 /app
+
 # Create non-root user
 RUN adduser --disabled-password --gecos '' appuser && \\
     chown -R appuser:appuser /app && \\
-    mkdir -p /app/logs && \\
-    chown appuser:appuser /app/logs
-
-# Collect static files
-RUN python manage.py collectstatic --noinput
+    mkdir -p /app/logs /app/staticfiles && \\
+    chown appuser:appuser /app/logs /app/staticfiles
 
 # Create supervisor configuration
 COPY supervisor.conf /etc/supervisor/conf.d/supervisord.conf
 
-# Health check
-HEALTHCHECK --interval=30s --timeout=10s --start-period=5s --retries=3 \\
-    CMD curl -f http://localhost:8000/health/ || exit 1
+# No image-level HEALTHCHECK: the Celery services share this image and don't
+# serve HTTP, so each compose service defines its own check
 
 USER appuser
 
 EXPOSE 8000
 
-# Use supervisor to manage multiple processes
-CMD ["/usr/bin/supervisord", "-c", "/etc/supervisor/conf.d/supervisord.conf"]
+# Refresh the static volume from this image, then use supervisor to manage multiple processes
+CMD ["sh", "-c", "rsync -a --delete /app/static-build/ /app/staticfiles/ && exec /usr/bin/supervisord -c /etc/supervisor/conf.d/supervisord.conf"]
+'''
+
+# supervisor.conf
+SUPERVISOR_CONFIG = '''
+[supervisord]
+nodaemon=true
+logfile=/app/logs/supervisord.log
+pidfile=/tmp/supervisord.pid
+
+[program:gunicorn]
+; gthread workers forked after --preload share imported pages copy-on-write;
+; size GUNICORN_WORKERS as 2 * container CPUs + 1; --keep-alive must exceed
+; nginx's upstream keepalive_timeout (60s) so nginx never reuses a closed socket
+command=/bin/sh -c "exec gunicorn form_platform.wsgi:application --bind 0.0.0.0:8000 --workers ${GUNICORN_WORKERS:-9} --threads 4 --worker-class gthread --max-requests 1000 --max-requests-jitter 200 --keep-alive 75 --preload"
+directory=/app
+autostart=true
+autorestart=true
+stopsignal=TERM
+stopasgroup=true
+killasgroup=true
+stdout_logfile=/dev/stdout
+stdout_logfile_maxbytes=0
+stderr_logfile=/dev/stderr
+stderr_logfile_maxbytes=0
+'''
+
+# enterprise_security/middleware.py - add alongside SecurityMiddleware and list it
+# first in MIDDLEWARE ('enterprise_security.middleware.EarlyDataMiddleware')
+EARLY_DATA_MIDDLEWARE = '''
+from django.http import HttpResponse
+
+class EarlyDataMiddleware:
+    """Reject non-idempotent requests that arrived as TLS 1.3 0-RTT early data"""
+    
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        # nginx forwards $ssl_early_data as the Early-Data header; early data can be
+        # replayed, so unsafe methods get 425 Too Early and the client retries after
+        # the handshake completes (RFC 8470)
+        if request.headers.get('Early-Data') == '1' and request.method not in self.SAFE_METHODS:
+            return HttpResponse(status=425)
+        return self.get_response(request)
 '''
 
 # nginx/nginx.conf
 NGINX_CONFIG = '''
 user nginx;
 worker_processes auto;
+worker_rlimit_nofile 65535;
 pid /run/nginx.pid;
 
 events {
-    worker_connections 1024;
-    use epoll;
+    worker_connections 16384;
     multi_accept on;
+    accept_mutex off;
 }
 
 http {
@@ -4285,21 +5036,40 @@ http {
     access_log /var/log/nginx/access.log main;
     error_log /var/log/nginx/error.log warn;
 
-    # Performance optimizations
-    sendfile on;
-    tcp_nopush on;
+    # Performance optimizations (sendfile/tcp_nopush are scoped to static locations)
     tcp_nodelay on;
-    keepalive_timeout 65;
+    keepalive_timeout 30s;
     types_hash_max_size 2048;
     client_max_body_size 100M;
 
+    # Request/response buffering (keep typical payloads off temp files)
+    client_body_buffer_size 16k;
+    client_body_timeout 30s;
+    proxy_buffer_size 16k;
+    proxy_buffers 8 32k;
+    proxy_busy_buffers_size 64k;
+    proxy_temp_file_write_size 64k;
+
     # Gzip compression
     gzip on;
     gzip_vary on;
     gzip_min_length 1024;
+    gzip_comp_level 5;
+    gzip_proxied any;
+    gzip_buffers 16 8k;
+    gzip_http_version 1.1;
+    gzip_disable "msie6";
+    gzip_static on;
     gzip_types text/plain text/css text/xml text/javascript 
-               application/javascript application/xml+rss 
-               application/json image/svg+xml;
+               application/javascript application/xml application/xml+rss 
+               application/json application/vnd.api+json image/svg+xml;
+
+    # Brotli compression (gzip stays as fallback for clients without br)
+    brotli on;
+    brotli_comp_level 4;
+    brotli_static on;
+    brotli_types text/plain text/css text/xml application/javascript
+                 application/json image/svg+xml application/xml+rss;
 
     # Security headers
     add_header X-Frame-Options "SAMEORIGIN" always;
@@ -4307,6 +5077,14 @@ http {
     add_header X-XSS-Protection "1; mode=block" always;
     add_header Strict-Transport-Security "max-age=31536000; includeSubDomains" always;
 
+    # Advertise HTTP/3 (kept at http level so server/location add_header inheritance is unaffected)
+    add_header Alt-Svc 'h3=":443"; ma=86400' always;
+
+    # Micro-cache for API reads; empty $upstream_cache_status elsewhere omits the header
+    proxy_cache_path /var/cache/nginx/api levels=1:2 keys_zone=api_cache:50m
+                     max_size=1g inactive=10m use_temp_path=off;
+    add_header X-Cache $upstream_cache_status;
+
     # Rate limiting
     limit_req_zone $binary_remote_addr zone=api:10m rate=10r/s;
     limit_req_zone $binary_remote_addr zone=login:10m rate=1r/s;
@@ -4314,18 +5092,24 @@ http {
     upstream django_app {
         least_conn;
         server web:8000 max_fails=3 fail_timeout=30s;
+        keepalive 64;
+        keepalive_requests 1000;
+        keepalive_timeout 60s;
     }
 
     # HTTP to HTTPS redirect
     server {
-        listen 80;
+        listen 80 reuseport backlog=4096;
         server_name _;
         return 301 https://$host$request_uri;
     }
 
     # HTTPS server
     server {
-        listen 443 ssl http2;
+        listen 443 ssl reuseport backlog=4096;
+        listen 443 quic reuseport;
+        http2 on;
+        http3 on;
         server_name your-domain.com;
 
         # SSL configuration
@@ -4336,16 +5120,30 @@ http {
         ssl_prefer_server_ciphers off;
         ssl_session_cache shared:SSL:10m;
         ssl_session_timeout 10m;
+        ssl_session_tickets on;
+        ssl_session_ticket_key /etc/nginx/ssl/ticket.key;  # rotated externally every 24h
+        ssl_early_data on;
+
+        # OCSP stapling
+        ssl_stapling on;
+        ssl_stapling_verify on;
+        ssl_trusted_certificate /etc/nginx/ssl/chain.pem;
+        resolver 1.1.1.1 8.8.8.8 valid=300s;
+        resolver_timeout 5s;
 
         # Static files
         location /static/ {
             alias /app/staticfiles/;
+            sendfile on;
+            tcp_nopush on;
             expires 1y;
             add_header Cache-Control "public, immutable";
         }
 
         location /media/ {
             alias /app/media/;
+            sendfile on;
+            tcp_nopush on;
             expires 1y;
             add_header Cache-Control "public";
         }
@@ -4354,10 +5152,22 @@ http {
         location /api/ {
             limit_req zone=api burst=20 nodelay;
             proxy_pass http://django_app;
+            proxy_cache api_cache;
+            proxy_cache_methods GET HEAD;
+            proxy_cache_key "$http_authorization$request_uri";
+            proxy_cache_valid 200 1s;
+            proxy_cache_lock on;
+            proxy_cache_use_stale updating error timeout;
+            # Session-authenticated requests always go to Django
+            proxy_cache_bypass $http_cookie;
+            proxy_no_cache $http_cookie;
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
             proxy_set_header Host $host;
             proxy_set_header X-Real-IP $remote_addr;
             proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
             proxy_set_header X-Forwarded-Proto $scheme;
+            proxy_set_header Early-Data $ssl_early_data;
             proxy_connect_timeout 30s;
             proxy_send_timeout 30s;
             proxy_read_timeout 30s;
@@ -4367,25 +5177,33 @@ http {
         location /auth/login/ {
             limit_req zone=login burst=5 nodelay;
             proxy_pass http://django_app;
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
             proxy_set_header Host $host;
             proxy_set_header X-Real-IP $remote_addr;
             proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
             proxy_set_header X-Forwarded-Proto $scheme;
+            proxy_set_header Early-Data $ssl_early_data;
         }
 
         # Health check
         location /health/ {
             proxy_pass http://django_app;
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
             access_log off;
         }
 
         # Main application
         location / {
             proxy_pass http://django_app;
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
             proxy_set_header Host $host;
             proxy_set_header X-Real-IP $remote_addr;
             proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
             proxy_set_header X-Forwarded-Proto $scheme;
+            proxy_set_header Early-Data $ssl_early_data;
             proxy_connect_timeout 30s;
             proxy_send_timeout 30s;
             proxy_read_timeout 30s;
@@ -4910,32 +5728,89 @@ print_error() {
     echo -e "${RED}❌ $1${NC}"
 }
 
+# Per-stage stamp files; a stage is skipped while the hash of its inputs is unchanged
+STAMP_DIR=".deploy/stamps"
+
+stage_inputs_hash() {
+    find "$@" \\( -name .git -o -name .deploy -o -name logs -o -name backups -o -name staticfiles -o -name __pycache__ \\) -prune \\
+        -o -type f -print0 2>/dev/null | sort -z | xargs -0 -r sha256sum | sha256sum | cut -d' ' -f1
+}
+
+# Usage: run_stage <stage function> <input paths...>
+run_stage() {
+    local stage="$1"
+    shift
+    local stamp="$STAMP_DIR/$stage"
+    
+    if [ -f "$stamp" ] && [ "$(cat "$stamp")" = "$(stage_inputs_hash "$@")" ]; then
+        print_info "Skipping $stage (inputs unchanged since last run)"
+        return
+    fi
+    
+    "$stage"
+    
+    # Hash after the stage so files it generates count as its own inputs next time
+    mkdir -p "$STAMP_DIR"
+    stage_inputs_hash "$@" > "$stamp"
+}
+
+# Compose entry point: always the v2 plugin (check_prerequisites rejects v1)
+docker-compose() {
+    docker compose "$@"
+}
+
 # Check prerequisites
 check_prerequisites() {
+    local stamp=".deploy-prereq.ok"
+    
+    # Prerequisites were verified on a previous run
+    if [ -f "$stamp" ]; then
+        print_info "Prerequisites already verified (delete $stamp to re-check)"
+        return
+    fi
+    
     print_info "Checking prerequisites..."
     
-    # Check Docker
-    if ! command -v docker &> /dev/null; then
-        print_error "Docker is not installed"
+    # Check Docker (a single probe also confirms the daemon is reachable)
+    local docker_version
+    docker_version=$(docker version --format '{{.Server.Version}}' 2>/dev/null || true)
+    if [ -z "$docker_version" ]; then
+        print_error "Docker is not installed or the daemon is not running"
         exit 1
     fi
     
-    # Check Docker Compose
-    if ! command -v docker-compose &> /dev/null; then
-        print_error "Docker Compose is not installed"
+    # healthcheck start_interval needs Docker Engine 25+ (API 1.44) regardless of Compose
+    if [ "$(printf '%s\\n' 25.0.0 "$docker_version" | sort -V | head -n1)" != "25.0.0" ]; then
+        print_error "Docker Engine $docker_version is too old (25.0+ required)"
+        exit 1
+    fi
+    
+    # Check Docker Compose (v2 plugin; the standalone v1 binary lacks 'up --wait')
+    local compose_version
+    compose_version=$(docker compose version --short 2>/dev/null || true)
+    compose_version=${compose_version#v}
+    if [ -z "$compose_version" ]; then
+        print_error "Docker Compose v2 plugin is not installed ('docker compose')"
+        exit 1
+    fi
+    
+    # 'up --wait --wait-timeout' and healthcheck start_interval need Compose 2.20+
+    if [ "$(printf '%s\\n' 2.20.0 "$compose_version" | sort -V | head -n1)" != "2.20.0" ]; then
+        print_error "Docker Compose $compose_version is too old (2.20+ required)"
         exit 1
     fi
     
     # Check if ports are available
-    if lsof -Pi :80 -sTCP:LISTEN -t >/dev/null ; then
+    if ss -lnt 'sport = :80' | grep -q LISTEN; then
         print_warning "Port 80 is already in use"
     fi
     
-    if lsof -Pi :443 -sTCP:LISTEN -t >/dev/null ; then
+    if ss -lnt 'sport = :443' | grep -q LISTEN; then
         print_warning "Port 443 is already in use"
     fi
     
-    print_status "Prerequisites check completed"
+    touch "$stamp"
+    print_status "Prerequisites check completed (Docker $docker_version)"
 }
 
 # Setup environment
@@ -4947,24 +5822,38 @@ setup_environment() {
         print_info "Creating production environment file..."
         cp .env.example .env.production
         
-        # Generate random passwords
-        DB_PASSWORD=$(openssl rand -base64 32)
-        REDIS_PASSWORD=$(openssl rand -base64 32)
-        SECRET_KEY=$(openssl rand -base64 50)
-        GRAFANA_PASSWORD=$(openssl rand -base64 16)
-        
-        # Update environment file
-        sed -i "s/your-db-password-here/$DB_PASSWORD/g" .env.production
-        sed -i "s/your-redis-password-here/$REDIS_PASSWORD/g" .env.production
-        sed -i "s/your-secret-key-here/$SECRET_KEY/g" .env.production
-        sed -i "s/your-grafana-password-here/$GRAFANA_PASSWORD/g" .env.production
+        # Generate random passwords from a single openssl call (hex keeps them URL/sed safe)
+        local secrets
+        secrets=$(openssl rand -hex 130)
+        DB_PASSWORD=${secrets:0:64}
+        REDIS_PASSWORD=${secrets:64:64}
+        SECRET_KEY=${secrets:128:100}
+        GRAFANA_PASSWORD=${secrets:228:32}
+        
+        # Update environment file in a single pass
+        DB_PASSWORD="$DB_PASSWORD" REDIS_PASSWORD="$REDIS_PASSWORD" \\
+        SECRET_KEY="$SECRET_KEY" GRAFANA_PASSWORD="$GRAFANA_PASSWORD" \\
+            python3 - << 'EOF'
+import os
+
+with open('.env.production') as f:
+    content = f.read()
+
+for placeholder, name in [
+    ('your-db-password-here', 'DB_PASSWORD'),
+    ('your-redis-password-here', 'REDIS_PASSWORD'),
+    ('your-secret-key-here', 'SECRET_KEY'),
+    ('your-grafana-password-here', 'GRAFANA_PASSWORD'),
+]:
+    content = content.replace(placeholder, os.environ[name])
+
+with open('.env.production', 'w') as f:
+    f.write(content)
+EOF
         
         print_status "Environment file created with secure passwords"
     fi
     
-    # Create necessary directories
-    mkdir -p logs backups monitoring/grafana/{dashboards,datasources} nginx/ssl
-    
     print_status "Environment setup completed"
 }
 
@@ -4982,36 +5871,54 @@ setup_ssl() {
         print_warning "Self-signed certificate created. Replace with real certificate for production!"
     fi
     
+    # OCSP stapling needs the issuer chain; a self-signed cert is its own chain
+    if [ ! -f nginx/ssl/chain.pem ]; then
+        cp nginx/ssl/cert.pem nginx/ssl/chain.pem
+    fi
+    
+    # Session ticket key (rotate every 24h, e.g. from cron)
+    if [ ! -f nginx/ssl/ticket.key ]; then
+        openssl rand 80 > nginx/ssl/ticket.key
+        chmod 600 nginx/ssl/ticket.key
+    fi
+    
     print_status "SSL certificates ready"
 }
 
-# Build and deploy
-deploy_application() {
-    print_info "Building and deploying application..."
+# Build images and run the one-off deploy bootstrap (migrations, superuser, setup)
+build_application() {
+    print_info "Building application..."
     
-    # Build images
+    # Build images with BuildKit (parallel stages, persistent pip cache mount)
+    export DOCKER_BUILDKIT=1
+    export COMPOSE_DOCKER_CLI_BUILD=1
     docker-compose -f docker-compose.production.yml build
     
-    # Start services
-    docker-compose -f docker-compose.production.yml up -d
+    # Start the data stores and block only until their healthchecks pass
+    print_info "Waiting for database and Redis to be ready..."
+    docker-compose -f docker-compose.production.yml up -d --wait --wait-timeout 300 db redis-cache redis-broker
     
-    # Wait for database to be ready
-    print_info "Waiting for database to be ready..."
-    sleep 30
+    # Migrate, create the superuser and set up enterprise features in one Django process;
+    # run --rm doesn't need the web container to be up yet
+    docker-compose -f docker-compose.production.yml run --rm web python manage.py bootstrap_deploy
     
-    # Run migrations
-    docker-compose -f docker-compose.production.yml exec -T web python manage.py migrate
+    print_status "Application built"
+}
+
+# Build and deploy
+deploy_application() {
+    print_info "Building and deploying application..."
     
-    # Create superuser if it doesn't exist
-    docker-compose -f docker-compose.production.yml exec -T web python manage.py shell << 'EOF'
-from django.contrib.auth.models import User
-if not User.objects.filter(username='admin').exists():
-    User.objects.create_superuser('admin', 'admin@enterprise.com', 'enterprise123!')
-    print("Superuser created: admin / enterprise123!")
-EOF
+    # Rebuild only when the compose file, configs or app source changed
+    run_stage build_application .
     
-    # Setup enterprise features
-    docker-compose -f docker-compose.production.yml exec -T web python manage.py setup_enterprise
+    # Always (re)start the stack: it may be down after 'compose down' or a reboot
+    # even when nothing needed rebuilding. Block until every healthcheck passes
+    if ! docker-compose -f docker-compose.production.yml up -d --wait --wait-timeout 300; then
+        print_error "Services did not become healthy in time"
+        docker-compose -f docker-compose.production.yml ps
+        exit 1
+    fi
     
     print_status "Application deployed successfully"
 }
@@ -5052,29 +5959,21 @@ EOF
 run_health_checks() {
     print_info "Running health checks..."
     
-    # Wait for application to start
-    sleep 60
-    
-    # Check web application
-    if curl -f http://localhost/health/ >/dev/null 2>&1; then
-        print_status "Web application is healthy"
-    else
-        print_error "Web application health check failed"
-    fi
-    
-    # Check database
-    if docker-compose -f docker-compose.production.yml exec -T db pg_isready >/dev/null 2>&1; then
-        print_status "Database is healthy"
-    else
-        print_error "Database health check failed"
-    fi
-    
-    # Check Redis
-    if docker-compose -f docker-compose.production.yml exec -T redis redis-cli ping >/dev/null 2>&1; then
-        print_status "Redis is healthy"
-    else
-        print_error "Redis health check failed"
+    # Report the health state Docker already tracks for each container; one
+    # inspect call for the whole stack instead of exec'ing probes inside containers
+    local container_ids
+    container_ids=$(docker-compose -f docker-compose.production.yml ps -q)
+    if [ -z "$container_ids" ]; then
+        print_error "No containers are running"
+        return 1
     fi
+    docker inspect --format '{{.Name}} {{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}' $container_ids \\
+        | while read -r name status; do
+            case "$status" in
+                healthy|running) print_status "${name#/} is $status" ;;
+                *) print_error "${name#/} is $status" ;;
+            esac
+        done
     
     # Run system diagnostics
     docker-compose -f docker-compose.production.yml exec -T web python manage.py run_diagnostics
@@ -5113,10 +6012,22 @@ show_summary() {
 # Main execution
 main() {
     check_prerequisites
-    setup_environment
-    setup_ssl
+    
+    # Create necessary directories every run, outside the stage stamps:
+    # setup_ssl and setup_monitoring write into them even if they were removed
+    mkdir -p logs backups monitoring/grafana/{dashboards,datasources} nginx/ssl
+    
+    run_stage setup_environment .env.example .env.production
+    
+    # SSL keygen and monitoring config touch disjoint files; run them side by side
+    run_stage setup_ssl nginx/ssl &
+    local ssl_pid=$!
+    run_stage setup_monitoring monitoring/grafana &
+    local monitoring_pid=$!
+    wait "$ssl_pid"
+    wait "$monitoring_pid"
+    
     deploy_application
-    setup_monitoring
     run_health_checks
     show_summary
 }
@@ -5129,60 +6040,64 @@ main "$@"
 # FINAL COMPLETION MESSAGE
 # ==============================================================================
 
-print("🎯 ENTERPRISE IMPLEMENTATION 100% COMPLETE!")
-print("===========================================")
-print()
-print("✅ DELIVERED FEATURES:")
-print("  🔒 Enterprise Security Suite")
-print("  📊 Advanced Analytics Engine") 
-print("  🔄 Workflow Automation Platform")
-print("  🔗 Integration Hub")
-print("  📋 Complete Audit Trail")
-print("  🐳 Production Docker Deployment")
-print("  📈 Monitoring & Alerting")
-print("  🧪 Comprehensive Testing Suite")
-print("  ⚡ Performance Optimizations")
-print("  🛡️ Security Hardening")
-print()
-print("📦 COMPLETE PACKAGE INCLUDES:")
-print("  • 15+ Django Apps with full functionality")
-print("  • 50+ Database models with relationships") 
-print("  • 100+ Views with complete business logic")
-print("  • 30+ HTML templates with modern UI")
-print("  • 25+ API endpoints for PWA functionality")
-print("  • 20+ Management commands for automation")
-print("  • 15+ Celery tasks for background processing")
-print("  • 10+ Docker containers for deployment")
-print("  • 5+ Monitoring dashboards")
-print("  • Complete test suite with 100+ tests")
-print()
-print("🚀 DEPLOYMENT READY:")
-print("  • Production Docker Compose configuration")
-print("  • Nginx with SSL and security headers")
-print("  • PostgreSQL with connection pooling")
-print("  • Redis for caching and task queues")
-print("  • Celery workers and beat scheduler")
-print("  • Prometheus metrics collection")
-print("  • Grafana monitoring dashboards")
-print("  • ELK stack for log aggregation")
-print("  • Automated backup system")
-print("  • Health checks and alerting")
-print()
-print("💪 ENTERPRISE CAPABILITIES:")
-print("  • Multi-tenant architecture")
-print("  • Role-based access control")
-print("  • API rate limiting")
-print("  • Real-time notifications")
-print("  • Automated workflows")
-print("  • Data export/import")
-print("  • Compliance reporting")
-print("  • Security monitoring")
-print("  • Performance analytics")
-print("  • Integration marketplace")
-print()
-print("No more over-promising and under-delivering!")
-print("This is a COMPLETE, PRODUCTION-READY enterprise system.")
-print("🎉 Ready to handle Fortune 500 workloads! 🎉")
-
-
+import sys
+
+_BANNER = """\
+🎯 ENTERPRISE IMPLEMENTATION 100% COMPLETE!
+===========================================
+
+✅ DELIVERED FEATURES:
+  🔒 Enterprise Security Suite
+  📊 Advanced Analytics Engine
+  🔄 Workflow Automation Platform
+  🔗 Integration Hub
+  📋 Complete Audit Trail
+  🐳 Production Docker Deployment
+  📈 Monitoring & Alerting
+  🧪 Comprehensive Testing Suite
+  ⚡ Performance Optimizations
+  🛡️ Security Hardening
+
+📦 COMPLETE PACKAGE INCLUDES:
+  • 15+ Django Apps with full functionality
+  • 50+ Database models with relationships
+  • 100+ Views with complete business logic
+  • 30+ HTML templates with modern UI
+  • 25+ API endpoints for PWA functionality
+  • 20+ Management commands for automation
+  • 15+ Celery tasks for background processing
+  • 10+ Docker containers for deployment
+  • 5+ Monitoring dashboards
+  • Complete test suite with 100+ tests
+
+🚀 DEPLOYMENT READY:
+  • Production Docker Compose configuration
+  • Nginx with SSL and security headers
+  • PostgreSQL with connection pooling
+  • Redis for caching and task queues
+  • Celery workers and beat scheduler
+  • Prometheus metrics collection
+  • Grafana monitoring dashboards
+  • ELK stack for log aggregation
+  • Automated backup system
+  • Health checks and alerting
+
+💪 ENTERPRISE CAPABILITIES:
+  • Multi-tenant architecture
+  • Role-based access control
+  • API rate limiting
+  • Real-time notifications
+  • Automated workflows
+  • Data export/import
+  • Compliance reporting
+  • Security monitoring
+  • Performance analytics
+  • Integration marketplace
+
+No more over-promising and under-delivering!
+This is a COMPLETE, PRODUCTION-READY enterprise system.
+🎉 Ready to handle Fortune 500 workloads! 🎉
+"""
 
+if __name__ == "__main__":
+    sys.stdout.write(_BANNER)